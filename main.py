@@ -1,12 +1,15 @@
 # main.py
 """Main entry point for the AIObot application."""
 
+import argparse
 import os
 
 from dotenv import load_dotenv
 
-from src.app import create_app
+from src.app import ActivityAssistant, create_app
+from src.batch import run_batch
 from src.constants import (
+    BATCH_CONCURRENCY,
     OPENAI_API_KEY_ENV,
     PROJECT_NAME,
     TICKETMASTER_KEY_ENV,
@@ -16,8 +19,32 @@ from src.constants import (
 from src.logger import logger
 
 
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description=f"{PROJECT_NAME} v{VERSION}")
+    parser.add_argument(
+        "--batch",
+        metavar="INPUT",
+        help="Run the prompts of a JSONL file instead of launching the UI",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="OUTPUT",
+        help="JSONL file for batch results (default: INPUT with .out.jsonl)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BATCH_CONCURRENCY,
+        help=f"Prompts processed at once in batch mode (default: {BATCH_CONCURRENCY})",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Run the AIObot application."""
+    args = parse_args()
+
     # Load environment variables
     load_dotenv(override=True)
 
@@ -37,6 +64,11 @@ def main():
 
     logger.info("✅ All API keys loaded successfully")
 
+    if args.batch:
+        output = args.output or os.path.splitext(args.batch)[0] + ".out.jsonl"
+        run_batch(ActivityAssistant(), args.batch, output, args.concurrency)
+        return
+
     # Create and launch the application
     _, gradio_interface = create_app()
     gradio_interface.launch(server_port=7860, share=False)
@@ -2,6 +2,7 @@
 """API modules for weather and events."""
 
 from src.api.events import BaseEventAPI, TicketmasterAPI
+from src.api.models import Event, Forecast
 from src.api.weather import WeatherAPI
 
-__all__ = ["WeatherAPI", "BaseEventAPI", "TicketmasterAPI"]
+__all__ = ["WeatherAPI", "BaseEventAPI", "TicketmasterAPI", "Forecast", "Event"]
@@ -0,0 +1,108 @@
+# src/api/cache.py
+"""Thread-safe in-memory cache for API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a time-to-live.
+
+    Each entry remembers whether it was read since it was last stored, so
+    background refreshes can skip data nobody asks for any more.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            ttl: Default time-to-live for entries, in seconds
+            maxsize: Maximum number of entries before the least recently used is evicted
+
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries[key] = (expires_at, value, True)
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        """Store a value under key.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (defaults to the cache TTL)
+
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value, False)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def peek(self, key):
+        """Return the cached value for key without counting it as a read.
+
+        Unlike ``get``, the LRU order and the read flag are left untouched.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def expiring(self, within: float) -> list:
+        """Return the keys of live, recently read entries expiring soon.
+
+        Only entries read since they were last stored are included; expired
+        entries and entries nobody read are left to expire and drop out.
+
+        Args:
+            within: Look-ahead window in seconds
+
+        Returns:
+            List of keys
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                key
+                for key, (expires_at, _, read) in self._entries.items()
+                if read and now < expires_at <= now + within
+            ]
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._entries)
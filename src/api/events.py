@@ -2,24 +2,39 @@
 """Event API integrations."""
 
 import os
+import time
 from abc import ABC, abstractmethod
 
 import requests
 
+from src.api.cache import TTLCache
+from src.api.jsonstream import iter_array_items
+from src.api.models import Event
 from src.constants import (
+    API_CACHE_MAXSIZE,
     API_TIMEOUT,
+    EVENTS_CACHE_TTL,
+    EVENTS_EMPTY_TTL,
+    STREAM_CHUNK_SIZE,
+    SUPPORTED_COUNTRIES,
     TICKETMASTER_API_URL,
     TICKETMASTER_EVENT_SIZE,
     TICKETMASTER_KEY_ENV,
+    TICKETMASTER_MAX_EVENTS,
+    TICKETMASTER_PAGE_SIZE,
+    TICKETMASTER_SORT,
 )
 from src.logger import logger
+from src.transport import create_session
 
 
 class BaseEventAPI(ABC):
     """Abstract base class for event APIs."""
 
     @abstractmethod
-    def get_events(self, city, country_code, keywords, start_date):
+    def get_events(
+        self, city, country_code, keywords, start_date, size=None, timeout=None
+    ):
         """Fetch upcoming events from an event provider.
 
         Args:
@@ -27,9 +42,11 @@ class BaseEventAPI(ABC):
             country_code: ISO Alpha-2 country code
             keywords: List of search keywords
             start_date: Start date for event search
+            size: Maximum number of events to return (provider default if None)
+            timeout: Seconds the upstream requests may take (defaults to API_TIMEOUT)
 
         Returns:
-            List of event dictionaries
+            List of Event records
 
         """
         pass
@@ -46,9 +63,15 @@ class TicketmasterAPI(BaseEventAPI):
             raise ValueError(
                 f"❌ {TICKETMASTER_KEY_ENV} environment variable is required"
             )
+        self.session = create_session()
+        self.cache = TTLCache(EVENTS_CACHE_TTL, API_CACHE_MAXSIZE)
+        # Optional PopularityTracker fed with every looked-up city
+        self.popularity = None
         logger.debug("TicketmasterAPI initialized successfully")
 
-    def get_events(self, city, country_code, keywords, start_date):
+    def get_events(
+        self, city, country_code, keywords, start_date, size=None, timeout=None
+    ):
         """Fetch upcoming events from Ticketmaster.
 
         Args:
@@ -56,47 +79,229 @@ class TicketmasterAPI(BaseEventAPI):
             country_code: ISO Alpha-2 country code (e.g., US, GB, CA)
             keywords: List of search keywords
             start_date: Start date in ISO format with timezone (e.g., 2025-01-15T00:00:00Z)
+            size: Maximum number of events to return (defaults to TICKETMASTER_EVENT_SIZE)
+            timeout: Seconds the upstream requests may take (defaults to API_TIMEOUT)
 
         Returns:
-            List of event dictionaries or error dict
+            List of Event records or error dict
 
         """
+        size = min(size or TICKETMASTER_EVENT_SIZE, TICKETMASTER_MAX_EVENTS)
+        key = self.cache_key(city, country_code, keywords, start_date)
+        if self.popularity:
+            self.popularity.add(key[0])
+
+        # Ticketmaster has no inventory outside these countries
+        if key[1] not in SUPPORTED_COUNTRIES:
+            logger.debug(f"Skipping event search for unsupported country {key[1]}")
+            return []
+
+        # A cached larger (or exhausted) search also answers smaller requests
+        cached = self.cache.get(key)
+        if cached and (cached[0] >= size or len(cached[1]) < cached[0]):
+            logger.debug(f"Events cache hit for {city}, {country_code}")
+            return cached[1][:size]
+
+        logger.debug(f"Fetching events for {city}, {country_code}")
+        try:
+            event_list, extent = self._search(
+                city, country_code, keywords, start_date, size, timeout
+            )
+        except requests.HTTPError as e:
+            status_code = e.response.status_code
+            logger.warning(f"Failed to fetch events for {city}: {status_code}")
+            return {
+                "error": f"API request failed! Status: {status_code}, "
+                f"Response: {e.response.text}"
+            }
+
+        logger.info(f"Found {len(event_list)} events for {city}")
+        # Empty searches are remembered only briefly
+        self.cache.set(
+            key, (extent, event_list), None if event_list else EVENTS_EMPTY_TTL
+        )
+        return event_list
+
+    def expiring(self, city, within):
+        """Return keys of a city's read searches expiring within ``within`` seconds.
+
+        Args:
+            city: Normalized (lowercase) city name
+            within: Look-ahead window in seconds
+
+        Returns:
+            List of cache keys (empty searches are never refreshed)
+
+        """
+        return [
+            key
+            for key in self.cache.expiring(within)
+            if key[0] == city and (self.cache.peek(key) or (0, []))[1]
+        ]
+
+    def refresh(self, key):
+        """Re-run a cached event search upstream and reset its expiry.
+
+        Args:
+            key: Cache key returned by ``expiring``
+
+        Returns:
+            True if the events were refreshed
+
+        """
+        cached = self.cache.peek(key)
+        if cached is None:
+            return False
+        city, country_code, keywords, start_date = key
+        try:
+            event_list, extent = self._search(
+                city, country_code, keywords, start_date, cached[0]
+            )
+        except requests.HTTPError as e:
+            logger.warning(f"Failed to refresh events for {city}: {e}")
+            return False
+        self.cache.set(
+            key, (extent, event_list), None if event_list else EVENTS_EMPTY_TTL
+        )
+        return True
+
+    def _search(self, city, country_code, keywords, start_date, size, timeout=None):
+        """Collect a search's events, keeping the pages fetched before a failure.
+
+        Args:
+            city: City name
+            country_code: ISO Alpha-2 country code
+            keywords: List of search keywords
+            start_date: Start date in ISO format with timezone
+            size: Maximum number of events to collect
+            timeout: Seconds the upstream requests may take (defaults to API_TIMEOUT)
+
+        Returns:
+            Tuple of (list of Event records, extent to cache them under). The
+            extent is ``size`` for a complete search, so a shorter list marks it
+            exhausted; a search cut short by a failed page only claims the
+            events it actually holds.
+
+        Raises:
+            requests.RequestException: If the first page request fails
+
+        """
+        event_list = []
+        try:
+            for event in self.iter_events(
+                city, country_code, keywords, start_date, size, timeout
+            ):
+                event_list.append(event)
+        except requests.RequestException as e:
+            if not event_list:
+                raise
+            reason = e.response.status_code if e.response is not None else e
+            logger.warning(
+                f"Stopped paging events for {city} after {len(event_list)} "
+                f"events: {reason}"
+            )
+            return event_list, len(event_list)
+        return event_list, size
+
+    @staticmethod
+    def cache_key(city, country_code, keywords, start_date):
+        """Build a normalized cache key for an event search.
+
+        Args:
+            city: City name
+            country_code: ISO Alpha-2 country code
+            keywords: List of search keywords
+            start_date: Start date in ISO format with timezone
+
+        Returns:
+            Hashable key that ignores case and keyword order
+
+        """
+        return (
+            (city or "").strip().lower(),
+            (country_code or "").strip().upper(),
+            tuple(sorted(k.strip().lower() for k in keywords or [])),
+            start_date,
+        )
+
+    def iter_events(
+        self, city, country_code, keywords, start_date, size=None, timeout=None
+    ):
+        """Lazily yield events page by page, in Ticketmaster's ranking order.
+
+        Each page is parsed while it downloads and only the projected fields
+        of each event are kept. No further page is requested once ``size``
+        events have been yielded or a short page signals the end of results.
+
+        Args:
+            city: City name
+            country_code: ISO Alpha-2 country code (e.g., US, GB, CA)
+            keywords: List of search keywords
+            start_date: Start date in ISO format with timezone (e.g., 2025-01-15T00:00:00Z)
+            size: Maximum number of events to yield (defaults to TICKETMASTER_EVENT_SIZE)
+            timeout: Seconds the whole search may take (each page is still
+                bounded by API_TIMEOUT)
+
+        Yields:
+            Event records
+
+        Raises:
+            requests.HTTPError: If a page request fails, after the events of
+                earlier pages were yielded
+            requests.Timeout: If no time is left for the next page
+
+        """
+        size = min(size or TICKETMASTER_EVENT_SIZE, TICKETMASTER_MAX_EVENTS)
+        page_size = min(size, TICKETMASTER_PAGE_SIZE)
         params = {
             "apikey": self.api_key,
             "city": city,
             "countryCode": country_code,
             "keyword": ",".join(keywords) if keywords else None,
-            "size": TICKETMASTER_EVENT_SIZE,
+            "size": page_size,
+            "sort": TICKETMASTER_SORT,
             "startDateTime": start_date,
         }
 
-        logger.debug(f"Fetching events for {city}, {country_code}")
-        response = requests.get(
-            TICKETMASTER_API_URL, params=params, timeout=API_TIMEOUT
-        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        remaining = size
+        page = 0
+        while remaining > 0:
+            params["page"] = page
+            page_timeout = API_TIMEOUT
+            if deadline is not None:
+                page_timeout = min(API_TIMEOUT, deadline - time.monotonic())
+                if page_timeout <= 0:
+                    raise requests.Timeout(f"No time left for event page {page}")
+            with self.session.get(
+                TICKETMASTER_API_URL, params=params, timeout=page_timeout, stream=True
+            ) as response:
+                if response.status_code != 200:
+                    # Read the body before the connection is released
+                    raise requests.HTTPError(response.text, response=response)
 
-        if response.status_code == 200:
-            data = response.json()
-            events = data.get("_embedded", {}).get("events", [])
-            event_list = (
-                [
-                    {
-                        "name": event["name"],
-                        "date": event["dates"]["start"]["localDate"],
-                        "venue": event["_embedded"]["venues"][0]["name"],
-                        "url": event.get("url", "N/A"),
-                    }
-                    for event in events
-                ]
-                if events
-                else []
-            )
+                count = 0
+                chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+                for event in iter_array_items(chunks, "events"):
+                    yield self._project_event(event)
+                    count += 1
+                    remaining -= 1
+                    if remaining == 0:
+                        break
+                # Read the rest of the page so the connection goes back to the pool
+                for _ in chunks:
+                    pass
 
-            logger.info(f"Found {len(event_list)} events for {city}")
-            return event_list
-        else:
-            logger.warning(f"Failed to fetch events for {city}: {response.status_code}")
-            return {
-                "error": f"API request failed! Status: {response.status_code}, "
-                f"Response: {response.text}"
-            }
+            if remaining == 0 or count < page_size:
+                return
+            page += 1
+
+    @staticmethod
+    def _project_event(event):
+        """Keep only the fields the assistant needs from a raw event."""
+        return Event(
+            name=event["name"],
+            date=event["dates"]["start"]["localDate"],
+            venue=event["_embedded"]["venues"][0]["name"],
+            url=event.get("url", "N/A"),
+        )
@@ -0,0 +1,104 @@
+# src/api/jsonstream.py
+"""Incremental JSON helpers for streaming API responses."""
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def iter_array_items(chunks: Iterable[bytes], key: str) -> Iterator:
+    """Yield the items of the first JSON array stored under ``key``.
+
+    The payload is consumed chunk by chunk and each array item is decoded on
+    its own as soon as its closing bracket arrives, so only the current item
+    is held in memory. Everything outside the array is skipped without being
+    decoded, and the source is no longer read once the array is closed.
+
+    Args:
+        chunks: Iterable of raw response bytes (e.g. ``response.iter_content()``)
+        key: Object key whose array value should be streamed
+
+    Yields:
+        Decoded array items (objects or arrays)
+
+    Raises:
+        ValueError: If the array contains scalars or the payload is malformed
+
+    """
+    chunks = iter(chunks)
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    json_decoder = json.JSONDecoder()
+    array_start = re.compile(rf'"{re.escape(key)}"\s*:\s*\[')
+    buffer = ""
+
+    def read_more():
+        nonlocal buffer
+        chunk = next(chunks, None)
+        if chunk is None:
+            buffer += text_decoder.decode(b"", final=True)
+            return False
+        buffer += text_decoder.decode(chunk)
+        return True
+
+    # Locate the start of the array, keeping only a small tail between reads
+    keep = len(key) + 64
+    while True:
+        match = array_start.search(buffer)
+        if match:
+            pos = match.end()
+            break
+        buffer = buffer[-keep:]
+        if not read_more():
+            return
+
+    while True:
+        # Skip separators between items
+        pos = _SEPARATORS.match(buffer, pos).end()
+        if pos >= len(buffer):
+            buffer, pos = "", 0
+            if not read_more():
+                return
+            continue
+
+        if buffer[pos] == "]":
+            return
+        if buffer[pos] not in "{[":
+            raise ValueError(f"Unsupported array item in '{key}' at: {buffer[pos]!r}")
+
+        # Scan forward to the matching closing bracket, reading as needed
+        start = scan = pos
+        depth = 0
+        in_string = False
+        while True:
+            pattern = _STRING_SPECIAL if in_string else _STRUCTURAL
+            match = pattern.search(buffer, scan)
+            if match is None or (match.group() == "\\" and match.end() >= len(buffer)):
+                scan = len(buffer) if match is None else match.start()
+                if not read_more():
+                    raise ValueError(f"Truncated JSON inside array '{key}'")
+                continue
+
+            char = match.group()
+            scan = match.end()
+            if in_string:
+                if char == "\\":
+                    scan += 1
+                else:
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    break
+
+        item = json_decoder.decode(buffer[start:scan])
+        buffer, pos = buffer[scan:], 0
+        yield item
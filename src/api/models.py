@@ -0,0 +1,52 @@
+# src/api/models.py
+"""Compact record types shared by the API providers."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Forecast:
+    """One day of weather forecast."""
+
+    date: str
+    temp: float
+    min_temp: float | None = None
+    max_temp: float | None = None
+    rain_chance: int | None = None
+    condition_code: int | None = None
+
+    def to_dict(self) -> dict:
+        """Return the record as a plain dictionary for JSON serialization."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True, frozen=True)
+class Event:
+    """A single upcoming event."""
+
+    name: str
+    date: str
+    venue: str
+    url: str = "N/A"
+
+    def to_dict(self) -> dict:
+        """Return the record as a plain dictionary for JSON serialization."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def to_json(value):
+    """Serialize record types for ``json.dumps(..., default=to_json)``.
+
+    Args:
+        value: Object that the JSON encoder cannot handle natively
+
+    Returns:
+        JSON-compatible representation of the record
+
+    Raises:
+        TypeError: If the value is not a known record type
+
+    """
+    if isinstance(value, Forecast | Event):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
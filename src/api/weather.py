@@ -3,54 +3,177 @@
 
 import os
 
-import requests
-
-from src.constants import API_TIMEOUT, WEATHER_API_URL, WEATHERAPI_KEY_ENV
+from src.api.cache import TTLCache
+from src.api.models import Forecast
+from src.constants import (
+    API_CACHE_MAXSIZE,
+    API_TIMEOUT,
+    MAX_FORECAST_DAYS,
+    WEATHER_API_URL,
+    WEATHER_CACHE_TTL,
+    WEATHER_DAY_FIELDS,
+    WEATHER_LEAN_FETCH,
+    WEATHER_LEAN_HOUR,
+    WEATHER_NEGATIVE_TTL,
+    WEATHER_NOT_FOUND_CODE,
+    WEATHERAPI_KEY_ENV,
+)
 from src.logger import logger
+from src.transport import create_session
 
 
 class WeatherAPI:
     """Fetches weather data from WeatherAPI.com."""
 
-    def __init__(self):
-        """Initialize WeatherAPI with API key from environment."""
+    def __init__(self, lean=WEATHER_LEAN_FETCH):
+        """Initialize WeatherAPI with API key from environment.
+
+        Args:
+            lean: Request a trimmed forecast payload
+
+        """
         self.api_key = os.getenv(WEATHERAPI_KEY_ENV)
         if not self.api_key:
             logger.error(f"❌ {WEATHERAPI_KEY_ENV} environment variable is required")
             raise ValueError(
                 f"❌ {WEATHERAPI_KEY_ENV} environment variable is required"
             )
-        logger.debug("WeatherAPI initialized successfully")
+        self.lean = lean
+        self.session = create_session()
+        self.cache = TTLCache(WEATHER_CACHE_TTL, API_CACHE_MAXSIZE)
+        # Optional PopularityTracker fed with every looked-up city
+        self.popularity = None
+        logger.debug(f"WeatherAPI initialized successfully (lean={lean})")
 
-    def get_weather(self, city: str, days: int) -> dict:
+    def get_weather(self, city: str, days: int, timeout: float | None = None) -> dict:
         """Fetch weather data for the given city.
 
         Args:
             city: The city name to get weather for
             days: Number of days for forecast (1-14)
+            timeout: Seconds the upstream request may take (defaults to API_TIMEOUT)
+
+        Returns:
+            Dictionary with the city and a list of Forecast records, or error dict
+
+        """
+        # A cached longer forecast also answers shorter requests
+        key = city.strip().lower()
+        if self.popularity:
+            self.popularity.add(key)
+        cached = self.cache.get(key)
+        if cached and cached[1] is None:
+            logger.debug(f"Weather negative cache hit for {city}")
+            return self._error(city)
+        if cached and cached[0] >= days:
+            logger.debug(f"Weather cache hit for {city} ({days} days)")
+            return {"city": city, "forecast": cached[1][:days]}
+
+        error_code, result = self._fetch_weather(city, days, timeout)
+        if "forecast" in result:
+            self.cache.set(key, (days, result["forecast"]))
+        elif error_code == WEATHER_NOT_FOUND_CODE:
+            # Unknown city: remember briefly so retries skip the round trip
+            self.cache.set(key, (MAX_FORECAST_DAYS, None), WEATHER_NEGATIVE_TTL)
+        return result
+
+    def expiring(self, city, within):
+        """Return keys of a city's read forecasts expiring within ``within`` seconds.
+
+        Args:
+            city: Normalized (lowercase) city name
+            within: Look-ahead window in seconds
+
+        Returns:
+            List of cache keys (negative entries are never refreshed)
+
+        """
+        return [
+            key
+            for key in self.cache.expiring(within)
+            if key == city and (self.cache.peek(key) or (0, None))[1] is not None
+        ]
+
+    def refresh(self, key):
+        """Re-fetch a cached forecast from upstream and reset its expiry.
+
+        Args:
+            key: Cache key returned by ``expiring``
 
         Returns:
-            Dictionary containing weather forecast data
+            True if the forecast was refreshed
+
+        """
+        cached = self.cache.peek(key)
+        if cached is None or cached[1] is None:
+            return False
+        _, result = self._fetch_weather(key, cached[0])
+        if "forecast" not in result:
+            return False
+        self.cache.set(key, (cached[0], result["forecast"]))
+        return True
+
+    def _fetch_weather(self, city, days, timeout=None):
+        """Fetch the forecast from WeatherAPI.com, bypassing the cache.
+
+        Returns:
+            Tuple of (WeatherAPI error code or None, weather dictionary or error dict)
 
         """
         params = {"key": self.api_key, "q": city, "days": days}
+        if self.lean:
+            # Drop air quality, alerts and all but one hourly slot per day
+            params.update(
+                {
+                    "aqi": "no",
+                    "alerts": "no",
+                    "hour": WEATHER_LEAN_HOUR,
+                    "day_fields": ",".join(WEATHER_DAY_FIELDS),
+                }
+            )
 
         logger.debug(f"Fetching weather for {city} for {days} days")
-        response = requests.get(WEATHER_API_URL, params=params, timeout=API_TIMEOUT)
-
-        if response.status_code == 200:
-            data = response.json()
-            forecast = []
-            for day in data["forecast"]["forecastday"]:
-                forecast.append({"date": day["date"], "temp": day["day"]["avgtemp_f"]})
-
-            logger.info(f"Successfully fetched weather for {city}")
-            return {"city": city, "forecast": forecast}
-        else:
-            logger.warning(
-                f"Failed to fetch weather for {city}: {response.status_code}"
-            )
-            return {
-                "error": f"City '{city}' not found or other issue. "
-                "Please check the city name and try again."
-            }
+        with self.session.get(
+            WEATHER_API_URL,
+            params=params,
+            timeout=API_TIMEOUT if timeout is None else min(timeout, API_TIMEOUT),
+        ) as response:
+            if response.status_code == 200:
+                days_data = response.json()["forecast"]["forecastday"]
+                forecast = [self._project_day(day) for day in days_data]
+
+                logger.info(f"Successfully fetched weather for {city}")
+                return None, {"city": city, "forecast": forecast}
+            else:
+                # 400 covers unknown locations as well as bad requests and
+                # internal errors; only the body's error code tells them apart
+                try:
+                    error_code = response.json()["error"]["code"]
+                except (ValueError, KeyError, TypeError):
+                    error_code = None
+                logger.warning(
+                    f"Failed to fetch weather for {city}: {response.status_code} "
+                    f"(error code {error_code})"
+                )
+                return error_code, self._error(city)
+
+    @staticmethod
+    def _error(city):
+        """Build the error returned when no forecast is available for a city."""
+        return {
+            "error": f"City '{city}' not found or other issue. "
+            "Please check the city name and try again."
+        }
+
+    @staticmethod
+    def _project_day(day):
+        """Keep a compact per-day summary from a raw forecast day."""
+        summary = day["day"]
+        return Forecast(
+            date=day["date"],
+            temp=summary["avgtemp_f"],
+            min_temp=summary.get("mintemp_f"),
+            max_temp=summary.get("maxtemp_f"),
+            rain_chance=summary.get("daily_chance_of_rain"),
+            condition_code=summary.get("condition", {}).get("code"),
+        )
@@ -1,10 +1,24 @@
 # src/app.py
 """Main application class that orchestrates all components."""
 
+import gradio as gr
+
 from src.api import TicketmasterAPI, WeatherAPI
 from src.assistant import ChatAssistant
+from src.constants import (
+    PREFETCH_ENABLED,
+    PREWARM_ENABLED,
+    TICKETMASTER_API_URL,
+    WARMER_ENABLED,
+    WEATHER_API_URL,
+)
 from src.logger import logger
+from src.memo import ToolMemo
+from src.prefetch import Prefetcher
+from src.profiler import TurnProfiler
+from src.transport import ConnectionWarmer
 from src.ui import GradioInterface
+from src.warmer import CacheWarmer
 
 
 class ActivityAssistant:
@@ -16,22 +30,61 @@ class ActivityAssistant:
         self.weather_api = WeatherAPI()
         self.event_apis = {"ticketmaster": TicketmasterAPI()}
         self.chat_assistant = ChatAssistant()
+        self.prefetcher = (
+            Prefetcher(self.weather_api, self.event_apis) if PREFETCH_ENABLED else None
+        )
+        self.tool_memo = ToolMemo()
+        self.profiler = TurnProfiler()
+        self.cache_warmer = None
+        if WARMER_ENABLED:
+            self.cache_warmer = CacheWarmer(self.weather_api, self.event_apis)
+            self.cache_warmer.start()
+        self.connection_warmer = None
+        if PREWARM_ENABLED:
+            self.connection_warmer = ConnectionWarmer(
+                [
+                    (
+                        self.chat_assistant.http_client,
+                        str(self.chat_assistant.openai.base_url),
+                    ),
+                    (self.weather_api.session, WEATHER_API_URL),
+                    (self.event_apis["ticketmaster"].session, TICKETMASTER_API_URL),
+                ]
+            )
+            self.connection_warmer.start()
         logger.info("ActivityAssistant initialized successfully")
 
-    def chat(self, user_message, history):
+    def chat(self, user_message, history, request: gr.Request = None):
         """Process a chat message and yield responses.
 
         Args:
             user_message: The user's message
             history: Conversation history
+            request: Gradio request, whose session scopes the tool result memo
+                and whose headers can ask for the turn to be profiled
 
         Yields:
             Response chunks from the assistant
 
         """
+        # A browser tab keeps its session across cleared chats, so an empty
+        # history starts a fresh memo
+        session_memo = None
+        if request is not None and request.session_hash:
+            session_memo = self.tool_memo.session(
+                request.session_hash, reset=not history
+            )
+
         response_stream = self.chat_assistant.chat(
-            user_message, history, self.weather_api, self.event_apis
+            user_message,
+            history,
+            self.weather_api,
+            self.event_apis,
+            self.prefetcher,
+            session_memo,
         )
+        if self.profiler.should_profile(request):
+            response_stream = self.profiler.profile(response_stream)
         yield from response_stream
 
 
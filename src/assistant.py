@@ -3,17 +3,52 @@
 
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
-from openai import OpenAI
+import httpx
+from openai import APITimeoutError, OpenAI
 
+from src.api.models import to_json
 from src.constants import (
     DEFAULT_MODEL,
+    FINAL_ANSWER_RESERVE,
     MAX_ACTIVITIES,
+    MEMO_CONTEXT_TEMPLATE,
+    MIN_CALL_TIMEOUT,
     OPENAI_API_KEY_ENV,
     SYSTEM_PROMPT_TEMPLATE,
+    TICKETMASTER_EVENT_SIZE,
+    TICKETMASTER_MAX_EVENTS,
+    TOOL_GRACE_PERIOD,
+    TOOL_WORKERS,
+    TURN_BUDGET,
+    TURN_TIMEOUT_MESSAGE,
+    TURN_TRUNCATED_NOTICE,
 )
 from src.logger import logger
+from src.transport import create_openai_http_client
+
+
+class DegradedAnswer(str):
+    """Final answer of a turn that did not fit its latency budget.
+
+    It is a plain string to the UI; batch mode checks the type to record the
+    turn as failed, so a resumed run retries it.
+    """
+
+    def __new__(cls, text, reason):
+        """Create the answer.
+
+        Args:
+            text: Answer text shown to the user
+            reason: Why the turn was degraded
+
+        """
+        answer = super().__new__(cls, text)
+        answer.reason = reason
+        return answer
 
 
 class ChatAssistant:
@@ -27,8 +62,14 @@ class ChatAssistant:
 
         """
         self.model = model
-        self.openai = OpenAI(api_key=os.getenv(OPENAI_API_KEY_ENV))
+        self.http_client = create_openai_http_client()
+        self.openai = OpenAI(
+            api_key=os.getenv(OPENAI_API_KEY_ENV), http_client=self.http_client
+        )
         self.tools = self._define_tools()
+        self.tool_executor = ThreadPoolExecutor(
+            max_workers=TOOL_WORKERS, thread_name_prefix="tool"
+        )
         self.system_message = self._create_system_message()
         logger.debug(f"ChatAssistant initialized with model: {model}")
 
@@ -48,7 +89,9 @@ class ChatAssistant:
                 "type": "function",
                 "function": {
                     "name": "get_weather",
-                    "description": "Get the current weather and forecast for the destination city.",
+                    "description": "Get the current weather and forecast for the destination city. "
+                    "Each day has average, min and max temperature (°F), rain chance (%) "
+                    "and a WeatherAPI condition code (1000 = sunny/clear).",
                     "parameters": {
                         "type": "object",
                         "properties": {
@@ -89,7 +132,7 @@ class ChatAssistant:
                             },
                             "size": {
                                 "type": "integer",
-                                "description": "Number of events to fetch.",
+                                "description": f"Number of events to fetch (max {TICKETMASTER_MAX_EVENTS}).",
                             },
                             "start_date": {
                                 "type": "string",
@@ -103,82 +146,131 @@ class ChatAssistant:
             },
         ]
 
-    def chat(self, user_message, history, weather_api, event_apis):
+    def chat(
+        self,
+        user_message,
+        history,
+        weather_api,
+        event_apis,
+        prefetcher=None,
+        session_memo=None,
+        deadline=None,
+    ):
         """Process a chat message and yield streaming responses.
 
+        The whole turn is bounded by ``deadline``: slow tool calls are
+        abandoned so the final answer can still be streamed in time.
+
         Args:
             user_message: The user's message
             history: Conversation history
             weather_api: WeatherAPI instance
             event_apis: Dictionary of event API instances
+            prefetcher: Optional Prefetcher that starts tool fetches early
+            session_memo: Optional SessionMemo of this conversation's tool results
+            deadline: time.monotonic() value by which the turn must end
+                (defaults to TURN_BUDGET seconds from now)
 
         Yields:
             Streaming response chunks
 
         """
+        if deadline is None:
+            deadline = time.monotonic() + TURN_BUDGET
+
+        # Start likely tool fetches while the model decides what to call
+        speculation = prefetcher.speculate(user_message) if prefetcher else None
+
         # Build the conversation
-        messages = (
-            [{"role": "system", "content": self.system_message}]
-            + history
-            + [{"role": "user", "content": user_message}]
-        )
+        messages = [{"role": "system", "content": self.system_message}] + history
 
-        # OpenAI response
-        response = self.openai.chat.completions.create(
-            model=self.model, messages=messages, tools=self.tools, stream=True
-        )
+        # Let follow-up turns reuse data the conversation already fetched
+        if session_memo is not None and len(session_memo):
+            data = json.dumps(session_memo.summary())
+            messages.append(
+                {"role": "system", "content": MEMO_CONTEXT_TEMPLATE.format(data=data)}
+            )
+        messages.append({"role": "user", "content": user_message})
 
         recovered_pieces = {"content": None, "role": "assistant", "tool_calls": {}}
         last_tool_calls = {}
         has_tool_call = False
         result = ""
+        # Tool calls must be received and run before the final answer's reserve
+        tool_deadline = deadline - FINAL_ANSWER_RESERVE
 
-        for chunk in response:
-            delta = chunk.choices[0].delta
-            finish_reason = chunk.choices[0].finish_reason
-
-            # Handle tool call detection
-            if delta.tool_calls and finish_reason in [None, "tool_calls"]:
-                has_tool_call = True
-                piece = delta.tool_calls[0]
-
-                # Create a dictionary for the tool call if it doesn't exist yet
-                recovered_pieces["tool_calls"][piece.index] = recovered_pieces[
-                    "tool_calls"
-                ].get(
-                    piece.index,
-                    {
-                        "id": None,
-                        "function": {"arguments": "", "name": ""},
-                        "type": "function",
-                    },
-                )
-
-                if piece.id:
-                    recovered_pieces["tool_calls"][piece.index]["id"] = piece.id
-                if piece.function.name:
-                    recovered_pieces["tool_calls"][piece.index]["function"]["name"] = (
-                        piece.function.name
+        # OpenAI response, cut off at the deadline
+        try:
+            response = self.openai.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                tools=self.tools,
+                stream=True,
+                timeout=self._time_left(tool_deadline),
+            )
+            for chunk in response:
+                delta = chunk.choices[0].delta
+                finish_reason = chunk.choices[0].finish_reason
+
+                # Handle tool call detection
+                if delta.tool_calls and finish_reason in [None, "tool_calls"]:
+                    has_tool_call = True
+                    piece = delta.tool_calls[0]
+
+                    # Create a dictionary for the tool call if it doesn't exist yet
+                    recovered_pieces["tool_calls"][piece.index] = recovered_pieces[
+                        "tool_calls"
+                    ].get(
+                        piece.index,
+                        {
+                            "id": None,
+                            "function": {"arguments": "", "name": ""},
+                            "type": "function",
+                        },
                     )
-                recovered_pieces["tool_calls"][piece.index]["function"][
-                    "arguments"
-                ] += piece.function.arguments
-
-                # Store the tool call in the dictionary by index
-                last_tool_calls[piece.index] = recovered_pieces["tool_calls"][
-                    piece.index
-                ]
 
-            # Store content in result and yield
-            else:
-                result += delta.content or ""
-                if result.strip():
-                    yield result
+                    if piece.id:
+                        recovered_pieces["tool_calls"][piece.index]["id"] = piece.id
+                    if piece.function.name:
+                        recovered_pieces["tool_calls"][piece.index]["function"][
+                            "name"
+                        ] = piece.function.name
+                    recovered_pieces["tool_calls"][piece.index]["function"][
+                        "arguments"
+                    ] += piece.function.arguments
+
+                    # Store the tool call in the dictionary by index
+                    last_tool_calls[piece.index] = recovered_pieces["tool_calls"][
+                        piece.index
+                    ]
+
+                # Store content in result and yield
+                else:
+                    result += delta.content or ""
+                    if result.strip():
+                        yield result
+
+                # Only a stream with more to come is cut short
+                cutoff = tool_deadline if has_tool_call else deadline
+                if finish_reason is None and time.monotonic() > cutoff:
+                    response.close()
+                    yield self._degraded(result, "first completion")
+                    return
+        except (APITimeoutError, httpx.TimeoutException):
+            yield self._degraded(result, "first completion")
+            return
 
         # Handle tool call scenario
         if has_tool_call:
             # Handle the tool calls
-            response = self._handle_tool_call(last_tool_calls, weather_api, event_apis)
+            response, unavailable = self._handle_tool_call(
+                last_tool_calls,
+                weather_api,
+                event_apis,
+                speculation,
+                session_memo,
+                tool_deadline,
+            )
 
             if response:
                 tool_calls_list = [tool_call for tool_call in last_tool_calls.values()]
@@ -190,31 +282,84 @@ class ChatAssistant:
                         {
                             "role": "tool",
                             "tool_call_id": res["tool_call_id"],
-                            "content": json.dumps(res["content"]),
+                            "content": json.dumps(res["content"], default=to_json),
                         }
                     )
 
-            # New OpenAI request with tool response
-            response = self.openai.chat.completions.create(
-                model=self.model, messages=messages, stream=True
-            )
-
+            # New OpenAI request with tool response, cut off at the deadline
             result = ""
-            for chunk in response:
-                result += chunk.choices[0].delta.content or ""
-                if result.strip():
-                    yield result
+            try:
+                response = self.openai.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    stream=True,
+                    timeout=self._time_left(deadline),
+                )
+                for chunk in response:
+                    result += chunk.choices[0].delta.content or ""
+                    if result.strip():
+                        yield result
+                    finish_reason = chunk.choices[0].finish_reason
+                    if finish_reason is None and time.monotonic() > deadline:
+                        response.close()
+                        yield self._degraded(result, "final completion")
+                        return
+            except (APITimeoutError, httpx.TimeoutException):
+                yield self._degraded(result, "final completion")
+                return
+
+            # The answer is complete but lacks the data of abandoned tools
+            if unavailable and result:
+                yield DegradedAnswer(result, f"{', '.join(unavailable)} unavailable")
+
+    @staticmethod
+    def _time_left(deadline):
+        """Return the seconds left before deadline, never below MIN_CALL_TIMEOUT."""
+        return max(deadline - time.monotonic(), MIN_CALL_TIMEOUT)
+
+    @staticmethod
+    def _degraded(result, stage):
+        """Build the answer for a completion that ran out of time.
+
+        Args:
+            result: Text generated before the deadline
+            stage: Completion that timed out, for logs and the degradation reason
 
-    def _handle_tool_call(self, tool_call, weather_api, event_apis):
+        Returns:
+            DegradedAnswer with the partial text, or an apology if there is none
+
+        """
+        logger.warning(f"The {stage} ran past the turn deadline")
+        text = result + TURN_TRUNCATED_NOTICE if result else TURN_TIMEOUT_MESSAGE
+        return DegradedAnswer(text, f"{stage} timed out")
+
+    def _handle_tool_call(
+        self,
+        tool_call,
+        weather_api,
+        event_apis,
+        speculation=None,
+        session_memo=None,
+        deadline=None,
+    ):
         """Handle tool calls and return responses.
 
+        The requested tools run concurrently, with upstream timeouts bounded
+        by the time left. Any still running at ``deadline`` are abandoned and
+        reported to the model as unavailable; they finish in the background
+        and still fill the caches.
+
         Args:
             tool_call: Dictionary of tool calls
             weather_api: WeatherAPI instance
             event_apis: Dictionary of event API instances
+            speculation: Optional Speculation with prefetches for this turn
+            session_memo: Optional SessionMemo of this conversation's tool results
+            deadline: Optional time.monotonic() value by which results are needed
 
         Returns:
-            List of tool call responses
+            Tuple of (list of tool call responses, sorted list of the tools
+            abandoned at the deadline)
 
         """
         stored_values = {}
@@ -230,22 +375,81 @@ class ChatAssistant:
         days = stored_values.get("days")
         country_code = stored_values.get("country_code")
         keywords = stored_values.get("keywords", [])
+        size = stored_values.get("size")
         start_date = stored_values.get("start_date")
         if start_date:
             start_date = str(start_date) + "T00:00:00Z"
 
-        weather_data = None
-        event_data = None
+        def time_left():
+            if deadline is None:
+                return None
+            return max(deadline - time.monotonic(), MIN_CALL_TIMEOUT)
+
+        # Each fetch answers from the conversation memo first
+        def fetch_weather():
+            if session_memo is not None:
+                data = session_memo.get_weather(city, days)
+                if data:
+                    logger.debug(f"Reusing conversation weather for {city}")
+                    return data
+            if speculation:
+                speculation.claim_weather(city, days, time_left())
+            data = weather_api.get_weather(city, days, time_left())
+            if session_memo is not None and "forecast" in data:
+                session_memo.put_weather(city, days, data["forecast"])
+            return data
+
+        def fetch_events():
+            event_api = event_apis["ticketmaster"]
+            event_key = event_api.cache_key(city, country_code, keywords, start_date)
+            event_size = size or TICKETMASTER_EVENT_SIZE
+            if session_memo is not None:
+                data = session_memo.get_events(event_key, event_size)
+                if data is not None:
+                    logger.debug(f"Reusing conversation events for {city}")
+                    return data
+            if speculation:
+                speculation.claim_events(event_key, size, time_left())
+            data = event_api.get_events(
+                city, country_code, keywords, start_date, size, time_left()
+            )
+            if session_memo is not None and isinstance(data, list):
+                session_memo.put_events(event_key, event_size, data)
+            return data
 
-        # Iteration over tool_call
+        # Iteration over tool_call, running each requested tool once
+        futures = {}
         for call in tool_call.values():
-            if call["function"]["name"] == "get_weather":
-                weather_data = weather_api.get_weather(city, days)
-
-            if call["function"]["name"] == "get_ticketmaster_events":
-                event_data = event_apis["ticketmaster"].get_events(
-                    city, country_code, keywords, start_date
-                )
+            if call["function"]["name"] == "get_weather" and "weather" not in futures:
+                futures["weather"] = self.tool_executor.submit(fetch_weather)
+            if (
+                call["function"]["name"] == "get_ticketmaster_events"
+                and "events" not in futures
+            ):
+                futures["events"] = self.tool_executor.submit(fetch_events)
+
+        # Results that are ready at once (memo, cache, finished prefetch) still
+        # get a short grace period when the deadline has already passed
+        timeout = None
+        if deadline is not None:
+            timeout = max(deadline - time.monotonic(), TOOL_GRACE_PERIOD)
+        done, _ = wait(futures.values(), timeout=timeout)
+
+        results = {}
+        timed_out = set()
+        for kind, future in futures.items():
+            if future not in done:
+                future.cancel()
+                timed_out.add(kind)
+                logger.warning(f"Tool call for {kind} exceeded the turn budget")
+                continue
+            try:
+                results[kind] = future.result()
+            except Exception as e:
+                logger.warning(f"Tool call for {kind} failed: {e}")
+
+        weather_data = results.get("weather")
+        event_data = results.get("events")
 
         responses = []
 
@@ -267,12 +471,15 @@ class ChatAssistant:
                 }
             )
         elif weather_tool_call_id:
+            message = (
+                "Weather data is not available right now."
+                if "weather" in timed_out
+                else "No weather data available for this location."
+            )
             responses.append(
                 {
                     "role": "assistant",
-                    "content": {
-                        "message": "No weather data available for this location."
-                    },
+                    "content": {"message": message},
                     "tool_call_id": weather_tool_call_id,
                 }
             )
@@ -295,12 +502,17 @@ class ChatAssistant:
                 }
             )
         elif event_tool_call_id:
+            message = (
+                "Event data is not available right now."
+                if "events" in timed_out
+                else "No events found for this location."
+            )
             responses.append(
                 {
                     "role": "assistant",
-                    "content": {"message": "No events found for this location."},
+                    "content": {"message": message},
                     "tool_call_id": event_tool_call_id,
                 }
             )
 
-        return responses
+        return responses, sorted(timed_out)
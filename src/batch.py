@@ -0,0 +1,149 @@
+# src/batch.py
+"""Batch mode: run a JSONL file of prompts through the assistant."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from src.assistant import DegradedAnswer
+from src.constants import BATCH_CONCURRENCY
+from src.logger import logger
+
+
+def _load_items(input_path):
+    """Read prompts from a JSONL file, assigning ids to items without one."""
+    items = []
+    with open(input_path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if "prompt" not in item:
+                raise ValueError(f"Line {line_number} of {input_path} has no 'prompt'")
+            item.setdefault("id", line_number)
+            items.append(item)
+    return items
+
+
+def _completed_ids(output_path):
+    """Return the ids already answered successfully in an existing output file."""
+    done = set()
+    if not Path(output_path).exists():
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                # A run interrupted mid-write can leave a partial last line
+                continue
+            if "error" not in result:
+                done.add(result["id"])
+    return done
+
+
+def _ends_with_newline(path):
+    """Return True if the file's last byte is a newline."""
+    with open(path, "rb") as f:
+        f.seek(-1, 2)
+        return f.read(1) == b"\n"
+
+
+def _answer(activity_assistant, item):
+    """Run one prompt and return its result record."""
+    started = time.monotonic()
+    first_chunk = None
+    answer = ""
+    try:
+        # The assistant yields the growing answer; the last chunk is complete
+        for chunk in activity_assistant.chat(item["prompt"], item.get("history", [])):
+            if first_chunk is None:
+                first_chunk = time.monotonic() - started
+            answer = chunk
+    except Exception as e:
+        logger.warning(f"Batch item {item['id']} failed: {e}")
+        return {
+            "id": item["id"],
+            "prompt": item["prompt"],
+            "error": str(e),
+            "elapsed": round(time.monotonic() - started, 3),
+        }
+
+    if isinstance(answer, DegradedAnswer):
+        # Recorded as an error so that resuming the batch retries the item
+        logger.warning(f"Batch item {item['id']} degraded: {answer.reason}")
+        return {
+            "id": item["id"],
+            "prompt": item["prompt"],
+            "answer": str(answer),
+            "error": f"Degraded answer: {answer.reason}",
+            "elapsed": round(time.monotonic() - started, 3),
+        }
+
+    return {
+        "id": item["id"],
+        "prompt": item["prompt"],
+        "answer": answer,
+        "first_chunk": None if first_chunk is None else round(first_chunk, 3),
+        "elapsed": round(time.monotonic() - started, 3),
+    }
+
+
+def run_batch(
+    activity_assistant, input_path, output_path, concurrency=BATCH_CONCURRENCY
+):
+    """Answer every prompt of a JSONL file, appending results as they finish.
+
+    Each input line is an object with a "prompt", plus optional "id" and
+    "history" (a list of chat messages). Items already answered in
+    ``output_path`` are skipped, so an interrupted run can simply be restarted.
+
+    Args:
+        activity_assistant: ActivityAssistant shared by all items (and its caches)
+        input_path: JSONL file of prompts
+        output_path: JSONL file results are appended to
+        concurrency: Maximum number of prompts processed at once
+
+    Returns:
+        Dictionary with counts of answered, failed and skipped items
+
+    """
+    items = _load_items(input_path)
+    done = _completed_ids(output_path)
+    pending = [item for item in items if item["id"] not in done]
+    logger.info(
+        f"📦 Batch: {len(pending)} prompts to run, {len(items) - len(pending)} "
+        f"already done, concurrency {concurrency}"
+    )
+
+    stats = {"answered": 0, "failed": 0, "skipped": len(items) - len(pending)}
+    with (
+        open(output_path, "a", encoding="utf-8") as out,
+        ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="batch"
+        ) as executor,
+    ):
+        futures = [
+            executor.submit(_answer, activity_assistant, item) for item in pending
+        ]
+        if out.tell() and not _ends_with_newline(output_path):
+            out.write("\n")
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                out.flush()
+                stats["failed" if "error" in result else "answered"] += 1
+                logger.info(
+                    f"Batch item {result['id']} done in {result['elapsed']}s "
+                    f"({stats['answered'] + stats['failed']}/{len(pending)})"
+                )
+        except BaseException:
+            # Don't run the queued prompts on Ctrl-C; a re-run resumes them
+            logger.warning("📦 Batch interrupted, cancelling queued prompts")
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    logger.info(f"📦 Batch finished: {stats}")
+    return stats
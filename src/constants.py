@@ -25,15 +25,105 @@ WEATHERAPI_KEY_ENV = "WEATHERAPI_KEY"
 TICKETMASTER_KEY_ENV = "TICKETMASTER_KEY"
 PORT_ENV_VAR = "PORT"
 
+# Per-turn sampling profiler (see src/profiler.py)
+PROFILE_RATE_ENV = "AIOBOT_PROFILE_RATE"  # fraction of turns to profile, e.g. 0.01
+PROFILE_FORCE_ENV = "AIOBOT_PROFILE"  # "1" profiles every turn
+PROFILE_DIR_ENV = "AIOBOT_PROFILE_DIR"
+PROFILE_HEADER = "x-aiobot-profile"  # "1" profiles that request's turn
+PROFILE_INTERVAL = 0.005  # seconds between stack samples
+PROFILE_MAX_FILES = 50  # newest profiles kept on disk
+PROFILE_WORKER_POOLS = ("tool", "prefetch")  # thread pools sampled during a turn
+
+# Record/replay of upstream traffic (see src/replay.py)
+REPLAY_MODE_ENV = "AIOBOT_REPLAY_MODE"  # "record" or "replay"
+REPLAY_FILE_ENV = "AIOBOT_REPLAY_FILE"
+REPLAY_SPEEDUP_ENV = "AIOBOT_REPLAY_SPEEDUP"  # 0 replays without waiting
+REPLAY_REDACTED_PARAMS = {"key", "apikey"}  # never written to recordings
+# Hosts whose request bodies embed the current date; replay may serve them the
+# next exchange for the endpoint when no exact match exists
+REPLAY_LOOSE_MATCH_HOSTS = {"api.openai.com"}
+
 # API Timeouts
 API_TIMEOUT = 10  # seconds
 
+# Per-turn latency budget
+TURN_BUDGET = 30  # seconds from the user's message to the end of the answer
+FINAL_ANSWER_RESERVE = 10  # seconds of the budget kept for the final completion
+MIN_CALL_TIMEOUT = 1  # seconds; floor for upstream timeouts near the deadline
+TOOL_GRACE_PERIOD = 0.1  # seconds cached/memoized tool results get past the deadline
+TOOL_WORKERS = 8  # threads running tool calls concurrently
+TURN_TIMEOUT_MESSAGE = (
+    "Sorry, this is taking longer than expected. Please try again in a moment! ⏳"
+)
+TURN_TRUNCATED_NOTICE = "\n\n_(Answer cut short to keep things snappy.)_"
+
+# Response caching
+WEATHER_CACHE_TTL = 30 * 60  # seconds
+EVENTS_CACHE_TTL = 60 * 60  # seconds
+API_CACHE_MAXSIZE = 1024  # entries per provider
+WEATHER_NEGATIVE_TTL = 5 * 60  # seconds to remember an unknown city
+WEATHER_NOT_FOUND_CODE = 1006  # WeatherAPI error code for "No location found"
+EVENTS_EMPTY_TTL = 10 * 60  # seconds to remember a search with no events
+
+# Background cache warming for popular cities
+WARMER_ENABLED = True
+WARMER_TOP_CITIES = 20
+WARMER_CALLS_PER_MINUTE = 30  # upstream refresh budget
+WARMER_INTERVAL = 30  # seconds between scans
+WARMER_LEAD_TIME = 120  # refresh entries this many seconds before expiry
+WARMER_DECAY_INTERVAL = 60 * 60  # halve popularity counts this often (seconds)
+WARMER_SKETCH_WIDTH = 2048
+WARMER_SKETCH_DEPTH = 4
+
+# Conversation-scoped memo of tool results
+MEMO_TTL = 60 * 60  # seconds of inactivity before a session's memo is dropped
+MEMO_MAX_SESSIONS = 1024
+MEMO_MAX_ENTRIES = 8  # tool results kept per session
+MEMO_CONTEXT_TEMPLATE = (
+    "Tool data already fetched earlier in this conversation; calling the tools "
+    "again with the same city, dates and keywords returns it instantly: {data}"
+)
+
+# Speculative prefetch of tool data
+PREFETCH_ENABLED = True
+PREFETCH_WORKERS = 4
+PREFETCH_MIN_WEATHER_DAYS = 3  # fetch a little ahead so follow-up days also hit
+
+# Connection tuning and keep-alive
+OPENAI_MAX_CONNECTIONS = 100
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 20
+OPENAI_KEEPALIVE_EXPIRY = 120  # seconds an idle pooled connection is kept
+OPENAI_HTTP2_ENV = "AIOBOT_HTTP2"  # "1" enables HTTP/2 (needs httpx[http2])
+PROVIDER_POOL_SIZE = 20  # pooled connections per weather/event host
+PREWARM_ENABLED = True  # open upstream connections at startup
+KEEPALIVE_INTERVAL = 45  # seconds between keep-alive pings (0 disables)
+
+# Streaming responses
+STREAM_CHUNK_SIZE = 16 * 1024  # bytes
+
 # Activity Recommendations
 MAX_ACTIVITIES = 10
 MAX_FORECAST_DAYS = 14
 
+# WeatherAPI Configuration
+WEATHER_LEAN_FETCH = True  # ask WeatherAPI for a trimmed payload
+WEATHER_LEAN_HOUR = 12  # single hourly slot kept per day in lean mode
+WEATHER_DAY_FIELDS = [
+    "avgtemp_f",
+    "mintemp_f",
+    "maxtemp_f",
+    "daily_chance_of_rain",
+    "condition",
+]
+
 # Ticketmaster Configuration
-TICKETMASTER_EVENT_SIZE = 10
+TICKETMASTER_EVENT_SIZE = 10  # default when the model doesn't ask for a size
+TICKETMASTER_MAX_EVENTS = 50  # upper bound for a single search
+TICKETMASTER_PAGE_SIZE = 20
+TICKETMASTER_SORT = "relevance,desc"
+
+# Batch mode
+BATCH_CONCURRENCY = 8
 
 # Gradio UI Configuration
 DEFAULT_SERVER_PORT = 7860
@@ -87,6 +177,138 @@ EXAMPLE_PROMPTS = [
 # Supported Countries (ISO Alpha-2 Codes)
 SUPPORTED_COUNTRIES = ["US", "CA", "GB", "AU", "AE", "NO", "NZ"]
 
+# City index used for local intent extraction (lowercase name -> (name, country))
+CITY_INDEX = {
+    "new york": ("New York", "US"),
+    "nyc": ("New York", "US"),
+    "los angeles": ("Los Angeles", "US"),
+    "chicago": ("Chicago", "US"),
+    "houston": ("Houston", "US"),
+    "san francisco": ("San Francisco", "US"),
+    "las vegas": ("Las Vegas", "US"),
+    "miami": ("Miami", "US"),
+    "boston": ("Boston", "US"),
+    "seattle": ("Seattle", "US"),
+    "washington": ("Washington", "US"),
+    "toronto": ("Toronto", "CA"),
+    "vancouver": ("Vancouver", "CA"),
+    "montreal": ("Montreal", "CA"),
+    "london": ("London", "GB"),
+    "manchester": ("Manchester", "GB"),
+    "edinburgh": ("Edinburgh", "GB"),
+    "sydney": ("Sydney", "AU"),
+    "melbourne": ("Melbourne", "AU"),
+    "dubai": ("Dubai", "AE"),
+    "abu dhabi": ("Abu Dhabi", "AE"),
+    "oslo": ("Oslo", "NO"),
+    "auckland": ("Auckland", "NZ"),
+    "wellington": ("Wellington", "NZ"),
+    "paris": ("Paris", "FR"),
+    "berlin": ("Berlin", "DE"),
+    "madrid": ("Madrid", "ES"),
+    "barcelona": ("Barcelona", "ES"),
+    "rome": ("Rome", "IT"),
+    "amsterdam": ("Amsterdam", "NL"),
+    "tokyo": ("Tokyo", "JP"),
+}
+
+# Event keywords recognized by the local intent extractor
+INTENT_EVENT_KEYWORDS = [
+    "music",
+    "concert",
+    "theater",
+    "theatre",
+    "cinema",
+    "comedy",
+    "sports",
+    "festival",
+]
+
+# Regions and countries that qualify a city name ("Paris, Texas"), in which
+# case the country in CITY_INDEX may be wrong
+INTENT_REGION_NAMES = [
+    # US states
+    "alabama",
+    "alaska",
+    "arizona",
+    "arkansas",
+    "california",
+    "colorado",
+    "connecticut",
+    "delaware",
+    "florida",
+    "georgia",
+    "hawaii",
+    "idaho",
+    "illinois",
+    "indiana",
+    "iowa",
+    "kansas",
+    "kentucky",
+    "louisiana",
+    "maine",
+    "maryland",
+    "massachusetts",
+    "michigan",
+    "minnesota",
+    "mississippi",
+    "missouri",
+    "montana",
+    "nebraska",
+    "nevada",
+    "new hampshire",
+    "new jersey",
+    "new mexico",
+    "new york",
+    "north carolina",
+    "north dakota",
+    "ohio",
+    "oklahoma",
+    "oregon",
+    "pennsylvania",
+    "rhode island",
+    "south carolina",
+    "south dakota",
+    "tennessee",
+    "texas",
+    "utah",
+    "vermont",
+    "virginia",
+    "washington",
+    "west virginia",
+    "wisconsin",
+    "wyoming",
+    # Canadian provinces, UK nations and Australian states
+    "alberta",
+    "british columbia",
+    "manitoba",
+    "nova scotia",
+    "ontario",
+    "quebec",
+    "england",
+    "scotland",
+    "wales",
+    "new south wales",
+    "victoria",
+    "queensland",
+    # Countries
+    "usa",
+    "united states",
+    "canada",
+    "uk",
+    "united kingdom",
+    "australia",
+    "new zealand",
+    "france",
+    "germany",
+    "spain",
+    "italy",
+    "netherlands",
+    "japan",
+    "norway",
+    "uae",
+]
+
 # System Prompt Template
 SYSTEM_PROMPT_TEMPLATE = """
 You are a fun, helpful assistant for an Activity Suggestion App.
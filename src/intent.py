@@ -0,0 +1,122 @@
+# src/intent.py
+"""Rule-based local intent extraction from user messages."""
+
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from src.constants import (
+    CITY_INDEX,
+    INTENT_EVENT_KEYWORDS,
+    INTENT_REGION_NAMES,
+    MAX_FORECAST_DAYS,
+)
+
+_WEEKDAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+
+# Longest names first so "new york" wins over a shorter overlapping entry
+_CITY_PATTERN = re.compile(
+    r"\b("
+    + "|".join(re.escape(name) for name in sorted(CITY_INDEX, key=len, reverse=True))
+    + r")\b"
+)
+_KEYWORD_PATTERN = re.compile(
+    r"\b(" + "|".join(re.escape(k) for k in INTENT_EVENT_KEYWORDS) + r")s?\b"
+)
+_WEEKDAY_PATTERN = re.compile(r"\b(" + "|".join(_WEEKDAYS) + r")\b")
+_NEXT_DAYS_PATTERN = re.compile(r"\b(?:next|coming)\s+(\d{1,2})\s+days\b")
+# Date expressions the rules below don't resolve; seeing one means "not sure"
+_UNRESOLVED_DATE_PATTERN = re.compile(
+    r"\b(weeks?|months?|years?|january|february|march|april|june|july|august"
+    r"|september|october|november|december|jan|feb|mar|apr|jun|jul|aug|sept?"
+    r"|oct|nov|dec)\b"
+    r"|\b\d{1,2}(st|nd|rd|th)\b|\d{1,4}[/-]\d{1,2}"
+    # "may" is only a month next to a day number ("may 3", "3 may")
+    r"|\bmay\s+\d{1,2}\b|\b\d{1,2}\s+may\b"
+    r"|\bin\s+\d+\s+days?\b"
+)
+# A city followed by ", <region>" ("Paris, Texas") may not be the indexed one
+_QUALIFIED_CITY_PATTERN = re.compile(
+    r"\s*,\s*(?:the\s+)?("
+    + "|".join(
+        re.escape(name) for name in sorted(INTENT_REGION_NAMES, key=len, reverse=True)
+    )
+    + r")\b"
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Intent:
+    """Tool arguments inferred from a user message."""
+
+    city: str
+    country_code: str
+    start_date: date
+    weather_days: int
+    keywords: tuple[str, ...] = ()
+
+
+def extract_intent(message: str, today: date | None = None) -> Intent | None:
+    """Infer the city and date a user is asking about, without calling the LLM.
+
+    Only messages that name a city from CITY_INDEX and use a date expression
+    the rules understand (or none, meaning today) produce an intent.
+
+    Args:
+        message: The user's message
+        today: Reference date (defaults to today)
+
+    Returns:
+        Intent if the message is confidently understood, otherwise None
+
+    """
+    text = message.lower()
+    city_match = _CITY_PATTERN.search(text)
+    if not city_match or _QUALIFIED_CITY_PATTERN.match(text, city_match.end()):
+        return None
+    city, country_code = CITY_INDEX[city_match.group(1)]
+
+    dates = _resolve_dates(text, today or date.today())
+    if dates is None:
+        return None
+    offset, span = dates
+
+    keywords = tuple(dict.fromkeys(m.group(1) for m in _KEYWORD_PATTERN.finditer(text)))
+    return Intent(
+        city=city,
+        country_code=country_code,
+        start_date=(today or date.today()) + timedelta(days=offset),
+        weather_days=min(offset + span, MAX_FORECAST_DAYS),
+        keywords=keywords,
+    )
+
+
+def _resolve_dates(text, today):
+    """Return (offset from today, number of days) for the message, or None."""
+    if _UNRESOLVED_DATE_PATTERN.search(text):
+        return None
+    if "tomorrow" in text:
+        return 1, 1
+    if "weekend" in text:
+        # Saturday is weekday 5; on Sunday only today remains
+        if today.weekday() == 6:
+            return 0, 1
+        return (5 - today.weekday()) % 7, 2
+
+    match = _NEXT_DAYS_PATTERN.search(text)
+    if match:
+        return 0, max(1, int(match.group(1)))
+
+    match = _WEEKDAY_PATTERN.search(text)
+    if match:
+        offset = (_WEEKDAYS.index(match.group(1)) - today.weekday()) % 7
+        return offset or 7, 1
+    return 0, 1
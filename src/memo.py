@@ -0,0 +1,196 @@
+# src/memo.py
+"""Conversation-scoped memo of tool results."""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+
+from src.api.cache import TTLCache
+from src.constants import (
+    EVENTS_CACHE_TTL,
+    MEMO_MAX_ENTRIES,
+    MEMO_MAX_SESSIONS,
+    MEMO_TTL,
+    WEATHER_CACHE_TTL,
+)
+
+
+class SessionMemo:
+    """Tool results already fetched in one conversation.
+
+    Entries age like the provider caches do, so a long conversation does not
+    keep serving data the providers would have refreshed.
+    """
+
+    def __init__(self, max_entries=MEMO_MAX_ENTRIES):
+        """Initialize the memo.
+
+        Args:
+            max_entries: Number of tool results kept before the oldest is dropped
+
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key, extent):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.monotonic():
+                del self._entries[key]
+                return None
+            if entry[0] < extent:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _put(self, key, extent, data, ttl):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > extent and entry[2] > now:
+                return
+            self._entries[key] = (extent, data, now + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_weather(self, city, days):
+        """Return a forecast fetched earlier in the conversation, sliced to ``days``.
+
+        Args:
+            city: City name
+            days: Number of forecast days needed
+
+        Returns:
+            Weather dictionary like ``WeatherAPI.get_weather`` or None
+
+        """
+        forecast = self._get(("weather", (city or "").strip().lower()), days or 1)
+        # After midnight a remembered forecast starts on yesterday
+        if not forecast or forecast[0].date != date.today().isoformat():
+            return None
+        return {"city": city, "forecast": forecast[: days or 1]}
+
+    def put_weather(self, city, days, forecast):
+        """Remember a forecast for the conversation.
+
+        Args:
+            city: City name
+            days: Number of forecast days fetched
+            forecast: List of Forecast records
+
+        """
+        self._put(
+            ("weather", (city or "").strip().lower()),
+            days or 1,
+            forecast,
+            WEATHER_CACHE_TTL,
+        )
+
+    def get_events(self, key, size):
+        """Return events found earlier in the conversation for the same search.
+
+        Args:
+            key: Normalized search key from the event provider
+            size: Number of events needed
+
+        Returns:
+            List of Event records or None
+
+        """
+        events = self._get(("events", key), size)
+        return None if events is None else events[:size]
+
+    def put_events(self, key, size, events):
+        """Remember an event search for the conversation.
+
+        Args:
+            key: Normalized search key from the event provider
+            size: Number of events requested
+            events: List of Event records
+
+        """
+        # Only claim the events actually held: a short list may come from a
+        # search cut short upstream, and the provider cache knows which
+        self._put(("events", key), min(size, len(events)), events, EVENTS_CACHE_TTL)
+
+    def summary(self):
+        """Return what is remembered, as dates and counts rather than the data.
+
+        The full records stay in the memo for the tool calls, which keeps the
+        prompt of every follow-up turn small.
+
+        Returns:
+            Dictionary with "weather" and "events" lists (empty if nothing is memoized)
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            entries = [item for item in self._entries.items() if item[1][2] > now]
+
+        summary = {"weather": [], "events": []}
+        for (kind, key), (_, data, _) in entries:
+            if kind == "weather":
+                summary["weather"].append(
+                    {
+                        "city": key,
+                        "days": len(data),
+                        "dates": [data[0].date, data[-1].date] if data else [],
+                    }
+                )
+            else:
+                city, country_code, keywords, start_date = key
+                summary["events"].append(
+                    {
+                        "city": city,
+                        "country_code": country_code,
+                        "keywords": list(keywords),
+                        "start_date": start_date,
+                        "count": len(data),
+                    }
+                )
+        return summary
+
+    def __len__(self):
+        """Return the number of remembered tool results that have not expired."""
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for entry in self._entries.values() if entry[2] > now)
+
+
+class ToolMemo:
+    """Holds one SessionMemo per chat session, expiring idle sessions."""
+
+    def __init__(self, ttl=MEMO_TTL, max_sessions=MEMO_MAX_SESSIONS):
+        """Initialize the memo store.
+
+        Args:
+            ttl: Seconds of inactivity after which a session's memo is dropped
+            max_sessions: Number of sessions kept before the least recent is dropped
+
+        """
+        self.sessions = TTLCache(ttl, max_sessions)
+        self._lock = threading.Lock()
+
+    def session(self, session_id, reset=False):
+        """Return the memo for a session, creating it if needed.
+
+        Args:
+            session_id: Chat session identifier
+            reset: Start a fresh memo, e.g. when a new conversation begins
+
+        Returns:
+            SessionMemo for the session
+
+        """
+        with self._lock:
+            memo = None if reset else self.sessions.get(session_id)
+            if memo is None:
+                memo = SessionMemo()
+            # Re-setting keeps active conversations from expiring
+            self.sessions.set(session_id, memo)
+        return memo
@@ -0,0 +1,181 @@
+# src/prefetch.py
+"""Speculative prefetch of tool data from the user's message."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.constants import (
+    MAX_FORECAST_DAYS,
+    PREFETCH_MIN_WEATHER_DAYS,
+    PREFETCH_WORKERS,
+    SUPPORTED_COUNTRIES,
+    TICKETMASTER_EVENT_SIZE,
+)
+from src.intent import extract_intent
+from src.logger import logger
+
+
+class Speculation:
+    """Prefetches started for one chat turn."""
+
+    def __init__(self, prefetcher, weather=None, events=None):
+        """Initialize the speculation.
+
+        Args:
+            prefetcher: Owning Prefetcher, which keeps the hit/miss counters
+            weather: Tuple of (city key, days, future) or None
+            events: Tuple of (search key, size, future) or None
+
+        """
+        self.prefetcher = prefetcher
+        self.weather = weather
+        self.events = events
+
+    def claim_weather(self, city, days, timeout=None):
+        """Wait for a matching weather prefetch and record a hit or miss.
+
+        After a hit the provider's cache holds the data, so the regular
+        ``get_weather`` call returns without going upstream.
+
+        Args:
+            city: City requested by the model
+            days: Number of forecast days requested by the model
+            timeout: Seconds to wait for the prefetch (None waits until it ends)
+
+        Returns:
+            True if the prefetch covered the request
+
+        """
+        hit = (
+            self.weather is not None
+            and self.weather[0] == (city or "").strip().lower()
+            and self.weather[1] >= (days or 1)
+        )
+        return self.prefetcher.record("weather", self.weather, hit, timeout)
+
+    def claim_events(self, key, size, timeout=None):
+        """Wait for a matching event prefetch and record a hit or miss.
+
+        Args:
+            key: Normalized search key from ``TicketmasterAPI.cache_key``
+            size: Number of events requested by the model
+            timeout: Seconds to wait for the prefetch (None waits until it ends)
+
+        Returns:
+            True if the prefetch covered the request
+
+        """
+        hit = (
+            self.events is not None
+            and self.events[0] == key
+            and self.events[1] >= (size or TICKETMASTER_EVENT_SIZE)
+        )
+        return self.prefetcher.record("events", self.events, hit, timeout)
+
+
+class Prefetcher:
+    """Starts weather and event fetches before the first LLM call."""
+
+    def __init__(self, weather_api, event_apis, max_workers=PREFETCH_WORKERS):
+        """Initialize the prefetcher.
+
+        Args:
+            weather_api: WeatherAPI instance
+            event_apis: Dictionary of event API instances
+            max_workers: Number of background fetch threads
+
+        """
+        self.weather_api = weather_api
+        self.event_apis = event_apis
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prefetch"
+        )
+        self.stats = {"hits": 0, "misses": 0, "skipped": 0}
+        self._lock = threading.Lock()
+
+    def speculate(self, user_message):
+        """Start fetches for the intent found in the message, if any.
+
+        Args:
+            user_message: The user's message
+
+        Returns:
+            Speculation for the turn (empty if no confident intent)
+
+        """
+        intent = extract_intent(user_message)
+        if intent is None:
+            logger.debug("No confident intent, skipping prefetch")
+            return Speculation(self)
+
+        logger.debug(f"Prefetching data for {intent}")
+        days = min(
+            max(intent.weather_days, PREFETCH_MIN_WEATHER_DAYS), MAX_FORECAST_DAYS
+        )
+        weather = (
+            intent.city.lower(),
+            days,
+            self.executor.submit(self.weather_api.get_weather, intent.city, days),
+        )
+
+        events = None
+        if intent.country_code in SUPPORTED_COUNTRIES:
+            event_api = self.event_apis["ticketmaster"]
+            start_date = intent.start_date.isoformat() + "T00:00:00Z"
+            keywords = list(intent.keywords)
+            events = (
+                event_api.cache_key(
+                    intent.city, intent.country_code, keywords, start_date
+                ),
+                TICKETMASTER_EVENT_SIZE,
+                self.executor.submit(
+                    event_api.get_events,
+                    intent.city,
+                    intent.country_code,
+                    keywords,
+                    start_date,
+                    TICKETMASTER_EVENT_SIZE,
+                ),
+            )
+
+        return Speculation(self, weather, events)
+
+    def record(self, kind, speculated, hit, timeout=None):
+        """Record the outcome of a speculation and wait for it on a hit.
+
+        Tool calls without a speculation (no confident intent) are counted as
+        skipped, so the hit rate only reflects speculations that ran.
+
+        Args:
+            kind: "weather" or "events"
+            speculated: Speculated (key, size, future) tuple or None
+            hit: Whether the speculation covers the actual tool call
+            timeout: Seconds to wait for a hit's fetch to finish
+
+        Returns:
+            The hit flag
+
+        """
+        if speculated is None:
+            with self._lock:
+                self.stats["skipped"] += 1
+            logger.debug(f"No prefetch ran for {kind}")
+            return False
+
+        if hit:
+            try:
+                speculated[2].result(timeout=timeout)
+            except Exception as e:
+                logger.warning(f"Prefetch of {kind} failed: {e}")
+
+        with self._lock:
+            self.stats["hits" if hit else "misses"] += 1
+            total = self.stats["hits"] + self.stats["misses"]
+            hit_rate = self.stats["hits"] / total
+
+        outcome = "hit" if hit else "miss"
+        logger.info(
+            f"Prefetch {outcome} for {kind} (hit rate {hit_rate:.0%} of {total}, "
+            f"{self.stats['skipped']} skipped)"
+        )
+        return hit
@@ -0,0 +1,195 @@
+# src/profiler.py
+"""Opt-in wall-clock sampling profiler for individual chat turns."""
+
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+
+from src.constants import (
+    PROFILE_DIR_ENV,
+    PROFILE_FORCE_ENV,
+    PROFILE_HEADER,
+    PROFILE_INTERVAL,
+    PROFILE_MAX_FILES,
+    PROFILE_RATE_ENV,
+    PROFILE_WORKER_POOLS,
+)
+from src.logger import logger
+
+# Pseudo-frame for time spent outside the turn, e.g. Gradio rendering a chunk
+_CONSUMER_FRAME = "[waiting for consumer]"
+
+
+def _collapse(frame, stop):
+    """Return the frame names from ``stop`` (excluded) down to ``frame``.
+
+    ``stop`` is a predicate on frames; the second value tells if one matched.
+    """
+    names = []
+    while frame is not None and not stop(frame):
+        code = frame.f_code
+        filename = os.path.basename(code.co_filename)
+        names.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names)), frame is not None
+
+
+def _is_work_item(frame):
+    """Return True for a thread pool worker's call into its current work item."""
+    back = frame.f_back
+    return frame.f_code.co_name == "run" and back and back.f_code.co_name == "_worker"
+
+
+class _TurnSampler:
+    """Samples the thread advancing a turn and the busy tool/prefetch workers.
+
+    Workers are shared, so when turns overlap their samples may include
+    another turn's work.
+    """
+
+    def __init__(self, interval, stop_code):
+        self.interval = interval
+        self.stop_code = stop_code
+        self.thread_id = None
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="turn-profiler", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            thread_id = self.thread_id
+            frame = frames.get(thread_id) if thread_id else None
+            if frame is None:
+                self.stacks[_CONSUMER_FRAME] += 1
+            else:
+                stack, _ = _collapse(frame, lambda f: f.f_code is self.stop_code)
+                self.stacks[stack] += 1
+
+            # Provider calls run on worker pools; idle workers are skipped
+            for thread in threading.enumerate():
+                pool = thread.name.split("_")[0]
+                if pool not in PROFILE_WORKER_POOLS:
+                    continue
+                frame = frames.get(thread.ident)
+                stack, busy = _collapse(frame, _is_work_item)
+                if busy:
+                    self.stacks[f"[{pool} worker];{stack}"] += 1
+
+
+class TurnProfiler:
+    """Profiles a sampled fraction of chat turns into flamegraph files.
+
+    Each profiled turn produces a collapsed-stack (``.folded``) file that
+    flamegraph.pl, speedscope or inferno can render. Only the newest
+    ``max_files`` profiles are kept on disk.
+    """
+
+    def __init__(
+        self,
+        rate=None,
+        directory=None,
+        max_files=PROFILE_MAX_FILES,
+        interval=PROFILE_INTERVAL,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            rate: Fraction of turns to profile (defaults to the AIOBOT_PROFILE_RATE env var, else 0)
+            directory: Output directory (defaults to the AIOBOT_PROFILE_DIR env var, else "profiles")
+            max_files: Number of profile files to keep
+            interval: Seconds between stack samples
+
+        """
+        self.rate = float(os.getenv(PROFILE_RATE_ENV, "0")) if rate is None else rate
+        self.directory = Path(directory or os.getenv(PROFILE_DIR_ENV, "profiles"))
+        self.max_files = max_files
+        self.interval = interval
+        self.forced = os.getenv(PROFILE_FORCE_ENV, "").lower() in ("1", "true", "yes")
+
+    def should_profile(self, request=None):
+        """Decide whether the current turn is profiled.
+
+        Args:
+            request: Optional Gradio request whose headers can force profiling
+
+        Returns:
+            True if the turn should be profiled
+
+        """
+        if self.forced:
+            return True
+        headers = getattr(request, "headers", None)
+        if headers and headers.get(PROFILE_HEADER, "").lower() in ("1", "true"):
+            return True
+        return self.rate > 0 and random.random() < self.rate
+
+    def profile(self, stream, label="turn"):
+        """Wrap a response generator so its whole lifetime is sampled.
+
+        Args:
+            stream: Generator of response chunks
+            label: Prefix for the profile file name
+
+        Yields:
+            The chunks of ``stream``, unchanged
+
+        """
+        sampler = _TurnSampler(self.interval, self._profiled.__code__)
+        started = time.monotonic()
+        sampler.start()
+        try:
+            yield from self._profiled(stream, sampler)
+        finally:
+            sampler.stop()
+            self._save(sampler.stacks, label, time.monotonic() - started)
+
+    @staticmethod
+    def _profiled(stream, sampler):
+        """Advance the stream, telling the sampler which thread is running it."""
+        try:
+            while True:
+                sampler.thread_id = threading.get_ident()
+                try:
+                    chunk = next(stream)
+                except StopIteration:
+                    return
+                finally:
+                    sampler.thread_id = None
+                yield chunk
+        finally:
+            stream.close()
+
+    def _save(self, stacks, label, elapsed):
+        """Write the collapsed stacks and prune old profiles."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = self.directory / f"{label}-{stamp}-{uuid.uuid4().hex[:8]}.folded"
+            path.write_text(
+                "".join(f"{stack} {count}\n" for stack, count in stacks.items()),
+                encoding="utf-8",
+            )
+            logger.info(f"🔬 Saved {elapsed:.2f}s turn profile to {path}")
+
+            profiles = sorted(
+                self.directory.glob("*.folded"), key=lambda p: p.stat().st_mtime
+            )
+            for old in profiles[: -self.max_files]:
+                old.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to save turn profile: {e}")
@@ -0,0 +1,377 @@
+# src/replay.py
+"""Record/replay of upstream HTTP traffic for offline, repeatable runs.
+
+Set ``AIOBOT_REPLAY_MODE`` to ``record`` to capture every upstream exchange
+(OpenAI, WeatherAPI, Ticketmaster), including the arrival time of each
+streamed chunk, into ``AIOBOT_REPLAY_FILE``. With ``replay`` the same
+exchanges are served back from the file without touching the network,
+at the recorded pace divided by ``AIOBOT_REPLAY_SPEEDUP`` (0 = no waiting).
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.constants import (
+    REPLAY_FILE_ENV,
+    REPLAY_LOOSE_MATCH_HOSTS,
+    REPLAY_MODE_ENV,
+    REPLAY_REDACTED_PARAMS,
+    REPLAY_SPEEDUP_ENV,
+    STREAM_CHUNK_SIZE,
+)
+from src.logger import logger
+
+# Response headers that no longer match once the body has been re-chunked
+_FRAMING_HEADERS = {"content-length", "transfer-encoding"}
+_DROPPED_HEADERS = _FRAMING_HEADERS | {"content-encoding"}
+
+
+def _redact_url(url):
+    """Remove API keys from a URL and sort its query for stable matching."""
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in REPLAY_REDACTED_PARAMS
+    )
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _without(headers, names):
+    """Return headers as a dict, minus the given (lowercase) names."""
+    return {k: v for k, v in headers.items() if k.lower() not in names}
+
+
+def _body_digest(body):
+    """Return a short digest of a request body."""
+    if body is None:
+        body = b""
+    elif isinstance(body, str):
+        body = body.encode()
+    return hashlib.sha1(body, usedforsecurity=False).hexdigest()[:16]
+
+
+class Cassette:
+    """Stores recorded exchanges in a (optionally gzipped) JSONL file."""
+
+    def __init__(self, path, mode, speedup=1.0):
+        """Initialize the cassette.
+
+        Args:
+            path: File to record to or replay from (".gz" suffix enables gzip)
+            mode: "record" or "replay"
+            speedup: Replay pace multiplier (0 serves chunks without waiting)
+
+        """
+        self.path = path
+        self.mode = mode
+        self.speedup = speedup
+        self._lock = threading.Lock()
+        self._exact = defaultdict(list)
+        self._by_endpoint = defaultdict(list)
+        if mode == "replay":
+            self._load()
+
+    def _open(self, mode):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode + "t", encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def _load(self):
+        with self._open("r") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        for entry in entries:
+            self._exact[(entry["method"], entry["url"], entry["body"])].append(entry)
+            self._by_endpoint[(entry["method"], entry["url"].split("?")[0])].append(
+                entry
+            )
+        logger.info(f"Loaded {len(entries)} recorded exchanges from {self.path}")
+
+    def record(self, method, url, body, status, headers, chunks):
+        """Append one exchange to the cassette.
+
+        Args:
+            method: HTTP method
+            url: Request URL (API keys are redacted before writing)
+            body: Request body bytes
+            status: Response status code
+            headers: Response headers matching the recorded body bytes
+            chunks: List of (seconds since request start, bytes) pairs
+
+        """
+        entry = {
+            "method": method,
+            "url": _redact_url(url),
+            "body": _body_digest(body),
+            "status": status,
+            "headers": headers,
+            "chunks": [
+                [round(t, 4), base64.b64encode(data).decode("ascii")]
+                for t, data in chunks
+            ],
+        }
+        with self._lock, self._open("a") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def match(self, method, url, body):
+        """Take the next recorded exchange for a request.
+
+        An exact match (URL and body) is required, except for hosts in
+        REPLAY_LOOSE_MATCH_HOSTS: their prompts embed the current date, so the
+        next unused exchange for the same endpoint is served instead.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            body: Request body bytes
+
+        Returns:
+            Recorded entry dictionary
+
+        Raises:
+            LookupError: If no matching recorded exchange is left
+
+        """
+        url = _redact_url(url)
+        with self._lock:
+            candidates = self._unused(
+                self._exact.get((method, url, _body_digest(body)))
+            )
+            loose = (
+                not candidates and urlsplit(url).hostname in REPLAY_LOOSE_MATCH_HOSTS
+            )
+            if loose:
+                candidates = self._unused(
+                    self._by_endpoint.get((method, url.split("?")[0]))
+                )
+            if not candidates:
+                raise LookupError(f"No recorded exchange for {method} {url}")
+            entry = candidates[0]
+            entry["used"] = True
+        if loose:
+            logger.warning(f"Replaying {method} {url} from a non-identical request")
+        return entry
+
+    @staticmethod
+    def _unused(entries):
+        return [e for e in entries or [] if not e.get("used")]
+
+    def iter_chunks(self, entry):
+        """Yield the recorded body chunks at the recorded (scaled) pace.
+
+        Args:
+            entry: Recorded entry dictionary
+
+        Yields:
+            Body chunks as bytes
+
+        """
+        start = time.monotonic()
+        for offset, data in entry["chunks"]:
+            if self.speedup > 0:
+                delay = offset / self.speedup - (time.monotonic() - start)
+                if delay > 0:
+                    time.sleep(delay)
+            yield base64.b64decode(data)
+
+
+class _ChunkReader:
+    """File-like object replaying recorded chunks for a requests Response."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def read(self, amt=None):
+        while not self._pending:
+            data = next(self._chunks, None)
+            if data is None:
+                return b""
+            self._pending = data
+        if amt is None:
+            data, self._pending = self._pending + b"".join(self._chunks), b""
+        else:
+            data, self._pending = self._pending[:amt], self._pending[amt:]
+        return data
+
+    def close(self):
+        pass
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Requests transport adapter that records or replays exchanges."""
+
+    def __init__(self, cassette, **kwargs):
+        """Initialize the adapter.
+
+        Args:
+            cassette: Cassette to record to or replay from
+            **kwargs: Connection pool options passed to HTTPAdapter
+
+        """
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        """Send a request through the cassette.
+
+        In record mode the live body is read completely (timing each chunk)
+        before the response is handed back.
+        """
+        if self.cassette.mode == "record":
+            start = time.monotonic()
+            response = super().send(request, stream=True, timeout=timeout, **kwargs)
+            chunks = [
+                (time.monotonic() - start, data)
+                for data in response.iter_content(STREAM_CHUNK_SIZE)
+            ]
+            response.close()
+            status = response.status_code
+            # iter_content() decodes gzip, so drop the encoding headers
+            headers = _without(response.headers, _DROPPED_HEADERS)
+            self.cassette.record(
+                request.method, request.url, request.body, status, headers, chunks
+            )
+            body = [data for _, data in chunks]
+        else:
+            try:
+                entry = self.cassette.match(request.method, request.url, request.body)
+            except LookupError as e:
+                raise requests.ConnectionError(str(e), request=request) from e
+            status, headers = entry["status"], entry["headers"]
+            body = self.cassette.iter_chunks(entry)
+
+        result = requests.Response()
+        result.request = request
+        result.url = request.url
+        result.status_code = status
+        result.headers = requests.structures.CaseInsensitiveDict(headers)
+        result.encoding = requests.utils.get_encoding_from_headers(result.headers)
+        result.raw = _ChunkReader(body)
+        return result
+
+
+class _RecordingStream(httpx.SyncByteStream):
+    """Passes a live response body through while timing each chunk."""
+
+    def __init__(self, stream, start, on_close):
+        self._stream = stream
+        self._start = start
+        self._on_close = on_close
+        self._chunks = []
+
+    def __iter__(self):
+        for data in self._stream:
+            self._chunks.append((time.monotonic() - self._start, data))
+            yield data
+
+    def close(self):
+        self._stream.close()
+        self._on_close(self._chunks)
+
+
+class _ReplayStream(httpx.SyncByteStream):
+    """Serves recorded chunks as an httpx response body."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def __iter__(self):
+        yield from self._chunks
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """httpx transport (used by the OpenAI client) that records or replays."""
+
+    def __init__(self, cassette, transport=None):
+        """Initialize the transport.
+
+        Args:
+            cassette: Cassette to record to or replay from
+            transport: Underlying transport used in record mode
+
+        """
+        self.cassette = cassette
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request):
+        """Handle a request through the cassette."""
+        body = request.read()
+        if self.cassette.mode == "record":
+            start = time.monotonic()
+            response = self.transport.handle_request(request)
+
+            # Body bytes are stored undecoded, so the encoding header stays
+            headers = _without(response.headers, _FRAMING_HEADERS)
+
+            def on_close(chunks):
+                self.cassette.record(
+                    request.method,
+                    str(request.url),
+                    body,
+                    response.status_code,
+                    headers,
+                    chunks,
+                )
+
+            return httpx.Response(
+                response.status_code,
+                headers=headers,
+                stream=_RecordingStream(response.stream, start, on_close),
+                extensions=response.extensions,
+            )
+
+        try:
+            entry = self.cassette.match(request.method, str(request.url), body)
+        except LookupError as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            stream=_ReplayStream(self.cassette.iter_chunks(entry)),
+        )
+
+    def close(self):
+        """Close the underlying transport."""
+        self.transport.close()
+
+
+def _load_cassette():
+    """Create the cassette configured through the environment, if any."""
+    mode = os.getenv(REPLAY_MODE_ENV, "").strip().lower()
+    if not mode:
+        return None
+    if mode not in ("record", "replay"):
+        raise ValueError(f"Invalid {REPLAY_MODE_ENV}: {mode} (use record or replay)")
+    path = os.getenv(REPLAY_FILE_ENV)
+    if not path:
+        raise ValueError(f"{REPLAY_FILE_ENV} is required when {REPLAY_MODE_ENV} is set")
+    speedup = float(os.getenv(REPLAY_SPEEDUP_ENV, "1"))
+    logger.info(f"🎞️ Upstream traffic {mode} mode using {path}")
+    return Cassette(path, mode, speedup)
+
+
+_cassette = None
+_cassette_lock = threading.Lock()
+_cassette_loaded = False
+
+
+def get_cassette():
+    """Return the process-wide cassette, or None when record/replay is off."""
+    global _cassette, _cassette_loaded
+    with _cassette_lock:
+        if not _cassette_loaded:
+            _cassette = _load_cassette()
+            _cassette_loaded = True
+    return _cassette
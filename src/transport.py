@@ -0,0 +1,132 @@
+# src/transport.py
+"""HTTP transport setup and connection keep-alive for upstream APIs."""
+
+import importlib.util
+import os
+import threading
+
+import httpx
+import requests
+from openai import DEFAULT_TIMEOUT
+from requests.adapters import HTTPAdapter
+
+from src.constants import (
+    API_TIMEOUT,
+    KEEPALIVE_INTERVAL,
+    OPENAI_HTTP2_ENV,
+    OPENAI_KEEPALIVE_EXPIRY,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    PROVIDER_POOL_SIZE,
+)
+from src.logger import logger
+from src.replay import ReplayAdapter, ReplayTransport, get_cassette
+
+
+def create_session():
+    """Create a requests session for an API provider.
+
+    The connection pool is sized for concurrent turns, and requests go
+    through the record/replay cassette when one is configured.
+
+    Returns:
+        Configured requests.Session
+
+    """
+    session = requests.Session()
+    cassette = get_cassette()
+    pool = {"pool_connections": PROVIDER_POOL_SIZE, "pool_maxsize": PROVIDER_POOL_SIZE}
+    adapter = ReplayAdapter(cassette, **pool) if cassette else HTTPAdapter(**pool)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_openai_http_client():
+    """Create the httpx client used by the OpenAI SDK.
+
+    HTTP/2 is opt-in through the AIOBOT_HTTP2 env var and needs the
+    optional ``h2`` package (``uv pip install "httpx[http2]"``).
+
+    Returns:
+        httpx.Client with tuned pool limits and keep-alive expiry
+
+    """
+    requested = os.getenv(OPENAI_HTTP2_ENV, "").lower() in ("1", "true", "yes")
+    http2 = requested and importlib.util.find_spec("h2") is not None
+    if requested and not http2:
+        logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+
+    limits = httpx.Limits(
+        max_connections=OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY,
+    )
+    transport = httpx.HTTPTransport(http2=http2, limits=limits)
+    cassette = get_cassette()
+    if cassette:
+        transport = ReplayTransport(cassette, transport)
+    return httpx.Client(
+        transport=transport, timeout=DEFAULT_TIMEOUT, follow_redirects=True
+    )
+
+
+class ConnectionWarmer:
+    """Keeps pooled connections to upstream hosts open between chat turns.
+
+    A cheap HEAD request per host runs at startup (paying DNS, TCP and TLS
+    setup before the first user arrives) and then every ``interval``
+    seconds so idle connections are not dropped.
+    """
+
+    def __init__(self, targets, interval=KEEPALIVE_INTERVAL):
+        """Initialize the warmer.
+
+        Args:
+            targets: List of (client, url) pairs; clients are requests sessions
+                or httpx clients whose pools should stay warm
+            interval: Seconds between keep-alive pings (0 only pre-warms)
+
+        """
+        self.targets = targets
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Pre-warm connections and keep them alive in the background."""
+        if get_cassette() is not None:
+            logger.debug("Record/replay active, skipping connection warming")
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="connection-warmer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the keep-alive thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        self.ping()
+        while self.interval > 0 and not self._stop.wait(self.interval):
+            self.ping()
+
+    def ping(self):
+        """Send one HEAD request per target; the status code is irrelevant.
+
+        Returns:
+            Number of hosts that answered
+
+        """
+        answered = 0
+        for client, url in self.targets:
+            try:
+                client.head(url, timeout=API_TIMEOUT)
+                answered += 1
+            except (requests.RequestException, httpx.HTTPError) as e:
+                logger.debug(f"Keep-alive ping to {url} failed: {e}")
+        logger.debug(f"Keep-alive ping reached {answered}/{len(self.targets)} hosts")
+        return answered
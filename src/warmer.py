@@ -0,0 +1,208 @@
+# src/warmer.py
+"""Background refresh of cached data for the most requested cities."""
+
+import hashlib
+import heapq
+import threading
+import time
+
+from src.constants import (
+    WARMER_CALLS_PER_MINUTE,
+    WARMER_DECAY_INTERVAL,
+    WARMER_INTERVAL,
+    WARMER_LEAD_TIME,
+    WARMER_SKETCH_DEPTH,
+    WARMER_SKETCH_WIDTH,
+    WARMER_TOP_CITIES,
+)
+from src.logger import logger
+from src.replay import get_cassette
+
+
+class PopularityTracker:
+    """Approximate per-city query counts in bounded memory.
+
+    Counts live in a count-min sketch; only the current top candidates are
+    kept by name. All counts are halved periodically so popularity follows
+    recent traffic.
+    """
+
+    def __init__(
+        self,
+        top_n=WARMER_TOP_CITIES,
+        width=WARMER_SKETCH_WIDTH,
+        depth=WARMER_SKETCH_DEPTH,
+        decay_interval=WARMER_DECAY_INTERVAL,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            top_n: Number of cities reported by ``top``
+            width: Counters per sketch row
+            depth: Number of sketch rows (independent hashes)
+            decay_interval: Seconds between halving all counts
+
+        """
+        self.top_n = top_n
+        self.width = width
+        self.depth = depth
+        self.decay_interval = decay_interval
+        self._rows = [[0] * width for _ in range(depth)]
+        self._candidates = {}
+        self._last_decay = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _indexes(self, city):
+        digest = hashlib.blake2b(city.encode(), digest_size=4 * self.depth).digest()
+        return [
+            int.from_bytes(digest[4 * row : 4 * row + 4], "little") % self.width
+            for row in range(self.depth)
+        ]
+
+    def add(self, city):
+        """Count one query for a city.
+
+        Args:
+            city: Normalized (lowercase) city name
+
+        """
+        with self._lock:
+            self._maybe_decay()
+            estimate = None
+            for row, index in zip(self._rows, self._indexes(city), strict=True):
+                row[index] += 1
+                estimate = row[index] if estimate is None else min(estimate, row[index])
+
+            self._candidates[city] = estimate
+            # Keep a few spare candidates so newcomers can climb into the top
+            if len(self._candidates) > 4 * self.top_n:
+                coldest = min(self._candidates, key=self._candidates.get)
+                del self._candidates[coldest]
+
+    def _maybe_decay(self):
+        if time.monotonic() - self._last_decay < self.decay_interval:
+            return
+        self._last_decay = time.monotonic()
+        for row in self._rows:
+            row[:] = [count // 2 for count in row]
+        self._candidates = {
+            city: count // 2 for city, count in self._candidates.items() if count > 1
+        }
+
+    def top(self, n=None):
+        """Return the most queried cities, most popular first.
+
+        Args:
+            n: Number of cities (defaults to ``top_n``)
+
+        Returns:
+            List of normalized city names
+
+        """
+        with self._lock:
+            self._maybe_decay()
+            return heapq.nlargest(
+                n or self.top_n, self._candidates, key=self._candidates.get
+            )
+
+
+class CacheWarmer:
+    """Refreshes hot cities' cached weather and events shortly before expiry."""
+
+    def __init__(
+        self,
+        weather_api,
+        event_apis,
+        tracker=None,
+        calls_per_minute=WARMER_CALLS_PER_MINUTE,
+        interval=WARMER_INTERVAL,
+        lead_time=WARMER_LEAD_TIME,
+    ):
+        """Initialize the warmer and attach its tracker to the providers.
+
+        Args:
+            weather_api: WeatherAPI instance
+            event_apis: Dictionary of event API instances
+            tracker: PopularityTracker (a new one is created if None)
+            calls_per_minute: Upstream refresh budget
+            interval: Seconds between scans
+            lead_time: Refresh entries expiring within this many seconds
+
+        """
+        self.tracker = tracker or PopularityTracker()
+        self.providers = [weather_api, *event_apis.values()]
+        for provider in self.providers:
+            provider.popularity = self.tracker
+        self.calls_per_minute = calls_per_minute
+        self.interval = interval
+        self.lead_time = lead_time
+        self._budget = float(calls_per_minute)
+        self._last_refill = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background warming thread (never while replaying)."""
+        cassette = get_cassette()
+        if cassette is not None and cassette.mode == "replay":
+            # Refreshes would consume recorded exchanges out of order
+            logger.debug("Replaying recorded traffic, cache warmer disabled")
+            return
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="cache-warmer", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"🔥 Cache warmer started (top {self.tracker.top_n} cities, "
+            f"{self.calls_per_minute} calls/min)"
+        )
+
+    def stop(self):
+        """Stop the background warming thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.warm()
+            except Exception as e:
+                logger.warning(f"Cache warming failed: {e}")
+
+    def _take_budget(self):
+        """Spend one upstream call from the per-minute token bucket."""
+        now = time.monotonic()
+        self._budget = min(
+            self.calls_per_minute,
+            self._budget + (now - self._last_refill) * self.calls_per_minute / 60,
+        )
+        self._last_refill = now
+        if self._budget < 1:
+            return False
+        self._budget -= 1
+        return True
+
+    def warm(self):
+        """Refresh the hottest cities' entries that are about to expire.
+
+        Returns:
+            Number of refreshed cache entries
+
+        """
+        refreshed = 0
+        for city in self.tracker.top():
+            for provider in self.providers:
+                for key in provider.expiring(city, self.lead_time):
+                    if not self._take_budget():
+                        logger.debug("Cache warmer budget exhausted for this minute")
+                        return refreshed
+                    if provider.refresh(key):
+                        refreshed += 1
+
+        if refreshed:
+            logger.info(f"🔥 Refreshed {refreshed} cache entries for popular cities")
+        return refreshed